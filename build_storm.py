@@ -0,0 +1,19 @@
+from numba.pycc import CC
+
+from storm_simulation import _simulate, _simulate_ensemble
+
+cc = CC("storm_native")
+
+
+@cc.export("simulate", "i8(f8[:], i8)")
+def simulate(state, seed):
+    return _simulate(state, seed)
+
+
+@cc.export("simulate_ensemble", "i8[:](f8[:, :], i8)")
+def simulate_ensemble(states, seed):
+    return _simulate_ensemble(states, seed)
+
+
+if __name__ == "__main__":
+    cc.compile()
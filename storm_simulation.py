@@ -1,196 +1,303 @@
-from dataclasses import dataclass
-from enum import Enum, auto
 import math
-import random
-
-
-class Phase(Enum):
-    BREWING = auto()
-    THRESHOLD = auto()
-    FULL_STORM = auto()
-    END = auto()
-
-
-@dataclass
-class StormState:
-    temperature: float
-    pressure: float
-    wind_speed: float
-    wind_direction: float
-    wind_instability: float
-    humidity: float
-    soil_temperature: float
-    shadow_density: float
-    petrichor_detected: bool
-    lightning_events: int
-    thunder_delay: float
-    rain_sound_detected: bool
-    rain_intensity: float
-    downdraft_force: float
-    lightning_frequency: float
-    turbulence: float
-    rain_particle_density: float
 
+import numpy as np
+from numba import njit
 
-class Storm:
-    def __init__(self):
-        self.state = Phase.BREWING
-        self.full_stage = "impact"
-        self.iteration = 0
-        self.constants = {
-            "brew_target_temp": 12.0,
-            "brew_temp_drop": 0.3,
-            "brew_pressure_drop": 0.5,
-            "brew_shadow_gain": 0.05,
-            "brew_wind_gain": 0.2,
-            "brew_humidity_gain": 1.5,
-            "petrichor_humidity": 68.0,
-            "petrichor_soil": 18.0,
-            "brew_pressure_threshold": 990.0,
-            "brew_wind_instability_threshold": 5.0,
-            "brew_shadow_threshold": 0.9,
-            "threshold_lightning_charge_gain": 8.0,
-            "threshold_lightning_threshold": 24.0,
-            "threshold_wind_gain": 1.1,
-            "threshold_humidity_gain": 2.2,
-            "threshold_saturation": 98.0,
-            "threshold_turbulent_wind": 18.0,
-            "threshold_min_lightning": 4,
-            "threshold_rain_distance_drop": 1.7,
-            "full_vertical_burst": 35.0,
-            "full_downpour_intensity": 60.0,
-            "full_frenzy_frequency": 12.0,
-            "full_turbulence_peak": 40.0,
-            "full_particle_density_peak": 85.0,
-            "silence_decay": 4.5,
-        }
-        self.charge = 0.0
-        self.lightning_distance = 18.0
-        self.sound_speed = 0.34
-        random.seed(0)
-        self.s = StormState(
-            temperature=20.0,
-            pressure=1012.0,
-            wind_speed=0.0,
-            wind_direction=0.0,
-            wind_instability=0.0,
-            humidity=45.0,
-            soil_temperature=20.0,
-            shadow_density=0.1,
-            petrichor_detected=False,
-            lightning_events=0,
-            thunder_delay=0.0,
-            rain_sound_detected=False,
-            rain_intensity=0.0,
-            downdraft_force=0.0,
-            lightning_frequency=0.0,
-            turbulence=0.0,
-            rain_particle_density=0.0,
-        )
+try:
+    import storm_native
+except ImportError:
+    storm_native = None
 
-    def run(self):
-        while self.state is not Phase.END:
-            if self.state is Phase.BREWING:
-                self._brewing_phase()
-            elif self.state is Phase.THRESHOLD:
-                self._threshold_phase()
-            elif self.state is Phase.FULL_STORM:
-                self._full_storm_phase()
-            self.iteration += 1
-
-    def _brewing_phase(self):
-        self.s.temperature = max(self.constants["brew_target_temp"], self.s.temperature - self.constants["brew_temp_drop"])
-        self.s.pressure = max(self.constants["brew_pressure_threshold"], self.s.pressure - self.constants["brew_pressure_drop"])
-        self.s.wind_instability += self.constants["brew_wind_gain"]
-        self.s.wind_speed = min(self.s.wind_speed + self.constants["brew_wind_gain"], self.constants["threshold_turbulent_wind"])
-        self.s.wind_direction = (self.s.wind_direction + 7.0 + math.sin(self.iteration)) % 360
-        self.s.humidity = min(100.0, self.s.humidity + self.constants["brew_humidity_gain"])
-        self.s.soil_temperature = max(10.0, self.s.soil_temperature - 0.1)
-        self.s.shadow_density = min(1.0, self.s.shadow_density + self.constants["brew_shadow_gain"])
-        if not self.s.petrichor_detected:
-            if self.s.humidity >= self.constants["petrichor_humidity"] and self.s.soil_temperature <= self.constants["petrichor_soil"]:
-                self.s.petrichor_detected = True
-        if self._brewing_complete():
-            self.state = Phase.THRESHOLD
-
-    def _brewing_complete(self):
-        return (
-            self.s.temperature <= self.constants["brew_target_temp"]
-            and self.s.pressure <= self.constants["brew_pressure_threshold"]
-            and self.s.wind_instability >= self.constants["brew_wind_instability_threshold"]
-            and self.s.shadow_density >= self.constants["brew_shadow_threshold"]
-            and self.s.petrichor_detected
+
+# Layout of the flat float64 state vector the jitted kernels operate on.
+# The six fields decayed by the silence stage sit in one contiguous block
+# [SILENCE_LO, SILENCE_HI) so the decay runs as a single slice operation.
+TEMPERATURE = 0
+PRESSURE = 1
+WIND_DIRECTION = 2
+WIND_INSTABILITY = 3
+HUMIDITY = 4
+SOIL_TEMPERATURE = 5
+SHADOW_DENSITY = 6
+PETRICHOR_DETECTED = 7
+LIGHTNING_EVENTS = 8
+THUNDER_DELAY = 9
+RAIN_SOUND_DETECTED = 10
+CHARGE = 11
+LIGHTNING_DISTANCE = 12
+WIND_SPEED = 13
+RAIN_INTENSITY = 14
+TURBULENCE = 15
+LIGHTNING_FREQUENCY = 16
+RAIN_PARTICLE_DENSITY = 17
+DOWNDRAFT_FORCE = 18
+PHASE = 19
+STAGE = 20
+N_VARS = 21
+
+SILENCE_LO = WIND_SPEED
+SILENCE_HI = DOWNDRAFT_FORCE + 1
+
+PHASE_BREWING = 0
+PHASE_THRESHOLD = 1
+PHASE_FULL_STORM = 2
+PHASE_END = 3
+
+STAGE_IMPACT = 0
+STAGE_DOWNPOUR = 1
+STAGE_FRENZY = 2
+STAGE_CHAOS = 3
+STAGE_SILENCE = 4
+
+
+BREW_TARGET_TEMP = 12.0
+BREW_TEMP_DROP = 0.3
+BREW_PRESSURE_DROP = 0.5
+BREW_SHADOW_GAIN = 0.05
+BREW_WIND_GAIN = 0.2
+BREW_HUMIDITY_GAIN = 1.5
+PETRICHOR_HUMIDITY = 68.0
+PETRICHOR_SOIL = 18.0
+BREW_PRESSURE_THRESHOLD = 990.0
+BREW_WIND_INSTABILITY_THRESHOLD = 5.0
+BREW_SHADOW_THRESHOLD = 0.9
+THRESHOLD_LIGHTNING_CHARGE_GAIN = 8.0
+THRESHOLD_LIGHTNING_THRESHOLD = 24.0
+THRESHOLD_WIND_GAIN = 1.1
+THRESHOLD_HUMIDITY_GAIN = 2.2
+THRESHOLD_SATURATION = 98.0
+THRESHOLD_TURBULENT_WIND = 18.0
+THRESHOLD_MIN_LIGHTNING = 4
+THRESHOLD_RAIN_DISTANCE_DROP = 1.7
+FULL_VERTICAL_BURST = 35.0
+FULL_DOWNPOUR_INTENSITY = 60.0
+FULL_FRENZY_FREQUENCY = 12.0
+FULL_TURBULENCE_PEAK = 40.0
+FULL_PARTICLE_DENSITY_PEAK = 85.0
+SILENCE_DECAY = 4.5
+
+_INV_SIN_HALF = 1.0 / math.sin(0.5)
+
+@njit("void(f8[:], f8)", cache=True)
+def _downpour_step(state, draw):
+    state[RAIN_INTENSITY] = min(FULL_DOWNPOUR_INTENSITY, state[RAIN_INTENSITY] + 5.0)
+    state[LIGHTNING_FREQUENCY] = max(state[LIGHTNING_FREQUENCY], 4.0 + draw)
+    state[WIND_SPEED] = min(40.0, state[WIND_SPEED] + 2.0)
+    state[TURBULENCE] += 3.5
+    if state[RAIN_INTENSITY] >= FULL_DOWNPOUR_INTENSITY and state[TURBULENCE] >= 10.0:
+        state[STAGE] = STAGE_FRENZY
+
+
+@njit("void(f8[:])", cache=True)
+def _frenzy_step(state):
+    state[LIGHTNING_FREQUENCY] = min(FULL_FRENZY_FREQUENCY, state[LIGHTNING_FREQUENCY] + np.random.uniform(1.5, 3.0))
+    state[TURBULENCE] = min(FULL_TURBULENCE_PEAK, state[TURBULENCE] + 4.2)
+    state[RAIN_PARTICLE_DENSITY] = min(FULL_PARTICLE_DENSITY_PEAK, state[RAIN_PARTICLE_DENSITY] + 9.0)
+    state[RAIN_INTENSITY] = min(80.0, state[RAIN_INTENSITY] + 4.0)
+    if state[LIGHTNING_FREQUENCY] >= FULL_FRENZY_FREQUENCY and state[TURBULENCE] >= 24.0:
+        state[STAGE] = STAGE_CHAOS
+
+
+@njit("void(f8[:], f8)", cache=True)
+def _chaos_step(state, draw):
+    state[TURBULENCE] = min(FULL_TURBULENCE_PEAK, state[TURBULENCE] + 2.0)
+    state[RAIN_PARTICLE_DENSITY] = min(FULL_PARTICLE_DENSITY_PEAK, state[RAIN_PARTICLE_DENSITY] + 4.0)
+    state[WIND_SPEED] = min(50.0, state[WIND_SPEED] + 1.5)
+    state[LIGHTNING_FREQUENCY] = max(state[LIGHTNING_FREQUENCY], 10.0 + draw)
+    if state[RAIN_PARTICLE_DENSITY] >= FULL_PARTICLE_DENSITY_PEAK and state[TURBULENCE] >= FULL_TURBULENCE_PEAK:
+        state[STAGE] = STAGE_SILENCE
+
+
+@njit("void(f8[:])", cache=True)
+def _silence_step(state):
+    decaying = state[SILENCE_LO:SILENCE_HI]
+    decaying[:] = np.maximum(decaying - SILENCE_DECAY, 0.0)
+    if (decaying <= 0.1).all():
+        state[PHASE] = PHASE_END
+
+
+@njit("i8(f8[:], i8)", cache=True)
+def _run_brewing(state, iteration):
+    if state[PHASE] != PHASE_BREWING:
+        return iteration
+    # Every brewing update is a bounded linear ramp, so the exit iteration
+    # can be computed analytically and the final values applied in O(1).
+    if state[PETRICHOR_DETECTED] == 1.0:
+        n_petrichor = 0
+    else:
+        n_petrichor = max(
+            math.ceil((PETRICHOR_HUMIDITY - state[HUMIDITY]) / BREW_HUMIDITY_GAIN),
+            math.ceil((state[SOIL_TEMPERATURE] - PETRICHOR_SOIL) / 0.1),
         )
+    n = max(
+        1,
+        math.ceil((state[TEMPERATURE] - BREW_TARGET_TEMP) / BREW_TEMP_DROP),
+        math.ceil((state[PRESSURE] - BREW_PRESSURE_THRESHOLD) / BREW_PRESSURE_DROP),
+        math.ceil((BREW_WIND_INSTABILITY_THRESHOLD - state[WIND_INSTABILITY]) / BREW_WIND_GAIN),
+        math.ceil((BREW_SHADOW_THRESHOLD - state[SHADOW_DENSITY]) / BREW_SHADOW_GAIN),
+        n_petrichor,
+    )
+    state[TEMPERATURE] = max(BREW_TARGET_TEMP, state[TEMPERATURE] - BREW_TEMP_DROP * n)
+    state[PRESSURE] = max(BREW_PRESSURE_THRESHOLD, state[PRESSURE] - BREW_PRESSURE_DROP * n)
+    state[WIND_INSTABILITY] += BREW_WIND_GAIN * n
+    state[WIND_SPEED] = min(state[WIND_SPEED] + BREW_WIND_GAIN * n, THRESHOLD_TURBULENT_WIND)
+    # sum(sin(k) for k in [i, i + n)) == sin(n / 2) * sin(i + (n - 1) / 2) / sin(1 / 2)
+    sin_sum = math.sin(n / 2.0) * math.sin(iteration + (n - 1) / 2.0) * _INV_SIN_HALF
+    state[WIND_DIRECTION] = (state[WIND_DIRECTION] + 7.0 * n + sin_sum) % 360
+    state[HUMIDITY] = min(100.0, state[HUMIDITY] + BREW_HUMIDITY_GAIN * n)
+    state[SOIL_TEMPERATURE] = max(10.0, state[SOIL_TEMPERATURE] - 0.1 * n)
+    state[SHADOW_DENSITY] = min(1.0, state[SHADOW_DENSITY] + BREW_SHADOW_GAIN * n)
+    if state[HUMIDITY] >= PETRICHOR_HUMIDITY and state[SOIL_TEMPERATURE] <= PETRICHOR_SOIL:
+        state[PETRICHOR_DETECTED] = 1.0
+    state[PHASE] = PHASE_THRESHOLD
+    return iteration + n
+
+
+@njit("i8(f8[:], i8)", cache=True)
+def _run_threshold(state, iteration):
+    if state[PHASE] != PHASE_THRESHOLD:
+        return iteration
+    # All exit conditions are affine ramps except the lightning counter,
+    # which advances per charge crossing; walk it event-by-event instead
+    # of iteration-by-iteration to find when the quota is met.
+    n_events = 0
+    charge = state[CHARGE]
+    events = state[LIGHTNING_EVENTS]
+    while events < THRESHOLD_MIN_LIGHTNING:
+        k = max(1, math.ceil((THRESHOLD_LIGHTNING_THRESHOLD - charge) / THRESHOLD_LIGHTNING_CHARGE_GAIN))
+        n_events += k
+        charge += THRESHOLD_LIGHTNING_CHARGE_GAIN * k - THRESHOLD_LIGHTNING_THRESHOLD * 0.7
+        events += 1.0
+    n = max(
+        1,
+        n_events,
+        math.ceil((THRESHOLD_TURBULENT_WIND - state[WIND_SPEED]) / THRESHOLD_WIND_GAIN),
+        math.ceil((THRESHOLD_SATURATION - state[HUMIDITY]) / THRESHOLD_HUMIDITY_GAIN),
+        math.ceil((state[LIGHTNING_DISTANCE] - 8.0) / THRESHOLD_RAIN_DISTANCE_DROP),
+        math.ceil((state[LIGHTNING_DISTANCE] - 20.0 * 0.34) / THRESHOLD_RAIN_DISTANCE_DROP),
+    )
+    # Replay the charge recurrence over the n iterations actually run.
+    remaining = n
+    while remaining > 0:
+        k = max(1, math.ceil((THRESHOLD_LIGHTNING_THRESHOLD - state[CHARGE]) / THRESHOLD_LIGHTNING_CHARGE_GAIN))
+        if k > remaining:
+            state[CHARGE] += THRESHOLD_LIGHTNING_CHARGE_GAIN * remaining
+            remaining = 0
+        else:
+            state[CHARGE] += THRESHOLD_LIGHTNING_CHARGE_GAIN * k - THRESHOLD_LIGHTNING_THRESHOLD * 0.7
+            state[LIGHTNING_EVENTS] += 1.0
+            remaining -= k
+    state[WIND_SPEED] += THRESHOLD_WIND_GAIN * n
+    # One bulk draw consumes the same n variates as the per-iteration loop,
+    # keeping the downstream stages on the same random stream.
+    state[WIND_DIRECTION] = (state[WIND_DIRECTION] + 23.0 * n + np.random.random(n).sum()) % 360
+    state[WIND_INSTABILITY] += 0.8 * n
+    state[LIGHTNING_DISTANCE] = max(1.0, state[LIGHTNING_DISTANCE] - THRESHOLD_RAIN_DISTANCE_DROP * n)
+    state[THUNDER_DELAY] = state[LIGHTNING_DISTANCE] / 0.34
+    if state[LIGHTNING_DISTANCE] <= 8.0:
+        state[RAIN_SOUND_DETECTED] = 1.0
+    state[HUMIDITY] = min(100.0, state[HUMIDITY] + THRESHOLD_HUMIDITY_GAIN * n)
+    state[PHASE] = PHASE_FULL_STORM
+    return iteration + n
 
-    def _threshold_phase(self):
-        self.charge += self.constants["threshold_lightning_charge_gain"]
-        if self.charge >= self.constants["threshold_lightning_threshold"]:
-            self.s.lightning_events += 1
-            self.charge -= self.constants["threshold_lightning_threshold"] * 0.7
-        self.s.wind_speed += self.constants["threshold_wind_gain"]
-        self.s.wind_direction = (self.s.wind_direction + 23.0 + random.random()) % 360
-        self.s.wind_instability += 0.8
-        self.lightning_distance = max(1.0, self.lightning_distance - self.constants["threshold_rain_distance_drop"])
-        self.s.thunder_delay = self.lightning_distance / self.sound_speed
-        if self.lightning_distance <= 8.0:
-            self.s.rain_sound_detected = True
-        self.s.humidity = min(100.0, self.s.humidity + self.constants["threshold_humidity_gain"])
-        if self._threshold_complete():
-            self.state = Phase.FULL_STORM
-
-    def _threshold_complete(self):
-        return (
-            self.s.lightning_events >= self.constants["threshold_min_lightning"]
-            and self.s.thunder_delay <= 20.0
-            and self.s.wind_speed >= self.constants["threshold_turbulent_wind"]
-            and self.s.rain_sound_detected
-            and self.s.humidity >= self.constants["threshold_saturation"]
+
+@njit("i8(f8[:], i8)", cache=True)
+def _run_full_storm(state, iteration):
+    if state[STAGE] == STAGE_IMPACT:
+        # rain_intensity starts non-negative, so += FULL_VERTICAL_BURST always
+        # meets the >= FULL_VERTICAL_BURST exit check: impact is a one-shot.
+        state[RAIN_INTENSITY] += FULL_VERTICAL_BURST
+        state[TEMPERATURE] = max(5.0, state[TEMPERATURE] - 1.8)
+        state[DOWNDRAFT_FORCE] += 6.0
+        state[STAGE] = STAGE_DOWNPOUR
+        iteration += 1
+    if state[STAGE] == STAGE_DOWNPOUR:
+        # Exit is deterministic (rain and turbulence ramp linearly), so the
+        # stage length is known up front and its variates can be drawn in
+        # one bulk call, consuming the same count as the scalar draws did.
+        n = max(
+            1,
+            math.ceil((FULL_DOWNPOUR_INTENSITY - state[RAIN_INTENSITY]) / 5.0),
+            math.ceil((10.0 - state[TURBULENCE]) / 3.5),
+        )
+        draws = np.random.random(n)
+        for i in range(n):
+            _downpour_step(state, draws[i])
+        iteration += n
+    while state[STAGE] == STAGE_FRENZY:
+        _frenzy_step(state)
+        iteration += 1
+    if state[STAGE] == STAGE_CHAOS:
+        n = max(
+            1,
+            math.ceil((FULL_TURBULENCE_PEAK - state[TURBULENCE]) / 2.0),
+            math.ceil((FULL_PARTICLE_DENSITY_PEAK - state[RAIN_PARTICLE_DENSITY]) / 4.0),
         )
+        draws = np.random.uniform(0.0, 2.5, n)
+        for i in range(n):
+            _chaos_step(state, draws[i])
+        iteration += n
+    while state[PHASE] != PHASE_END:
+        _silence_step(state)
+        iteration += 1
+    return iteration
+
+
+@njit("i8(f8[:], i8)", cache=True)
+def _simulate(state, seed):
+    np.random.seed(seed)
+    iteration = _run_brewing(state, 0)
+    iteration = _run_threshold(state, iteration)
+    iteration = _run_full_storm(state, iteration)
+    return iteration
+
+
+@njit("i8[:](f8[:, :], i8)", cache=True)
+def _simulate_ensemble(states, seed):
+    iterations = np.empty(states.shape[0], dtype=np.int64)
+    for i in range(states.shape[0]):
+        iterations[i] = _simulate(states[i], seed + i)
+    return iterations
+
 
-    def _full_storm_phase(self):
-        if self.full_stage == "impact":
-            self.s.rain_intensity += self.constants["full_vertical_burst"]
-            self.s.temperature = max(5.0, self.s.temperature - 1.8)
-            self.s.downdraft_force += 6.0
-            if self.s.rain_intensity >= self.constants["full_vertical_burst"]:
-                self.full_stage = "downpour"
-        elif self.full_stage == "downpour":
-            self.s.rain_intensity = min(self.constants["full_downpour_intensity"], self.s.rain_intensity + 5.0)
-            self.s.lightning_frequency = max(self.s.lightning_frequency, 4.0 + random.random())
-            self.s.wind_speed = min(40.0, self.s.wind_speed + 2.0)
-            self.s.turbulence += 3.5
-            if self.s.rain_intensity >= self.constants["full_downpour_intensity"] and self.s.turbulence >= 10.0:
-                self.full_stage = "frenzy"
-        elif self.full_stage == "frenzy":
-            self.s.lightning_frequency = min(self.constants["full_frenzy_frequency"], self.s.lightning_frequency + random.uniform(1.5, 3.0))
-            self.s.turbulence = min(self.constants["full_turbulence_peak"], self.s.turbulence + 4.2)
-            self.s.rain_particle_density = min(self.constants["full_particle_density_peak"], self.s.rain_particle_density + 9.0)
-            self.s.rain_intensity = min(80.0, self.s.rain_intensity + 4.0)
-            if self.s.lightning_frequency >= self.constants["full_frenzy_frequency"] and self.s.turbulence >= 24.0:
-                self.full_stage = "chaos"
-        elif self.full_stage == "chaos":
-            self.s.turbulence = min(self.constants["full_turbulence_peak"], self.s.turbulence + 2.0)
-            self.s.rain_particle_density = min(self.constants["full_particle_density_peak"], self.s.rain_particle_density + 4.0)
-            self.s.wind_speed = min(50.0, self.s.wind_speed + 1.5)
-            self.s.lightning_frequency = max(self.s.lightning_frequency, 10.0 + random.uniform(0.0, 2.5))
-            if self.s.turbulence >= self.constants["full_turbulence_peak"] and self.s.rain_particle_density >= self.constants["full_particle_density_peak"]:
-                self.full_stage = "silence"
-        elif self.full_stage == "silence":
-            self.s.rain_intensity = max(0.0, self.s.rain_intensity - self.constants["silence_decay"])
-            self.s.wind_speed = max(0.0, self.s.wind_speed - self.constants["silence_decay"])
-            self.s.turbulence = max(0.0, self.s.turbulence - self.constants["silence_decay"])
-            self.s.lightning_frequency = max(0.0, self.s.lightning_frequency - self.constants["silence_decay"])
-            self.s.rain_particle_density = max(0.0, self.s.rain_particle_density - self.constants["silence_decay"])
-            self.s.downdraft_force = max(0.0, self.s.downdraft_force - self.constants["silence_decay"])
-            if all(value <= 0.1 for value in [
-                self.s.rain_intensity,
-                self.s.wind_speed,
-                self.s.turbulence,
-                self.s.lightning_frequency,
-                self.s.rain_particle_density,
-                self.s.downdraft_force,
-            ]):
-                self.state = Phase.END
+def _seed_initial(states):
+    states[..., TEMPERATURE] = 20.0
+    states[..., PRESSURE] = 1012.0
+    states[..., HUMIDITY] = 45.0
+    states[..., SOIL_TEMPERATURE] = 20.0
+    states[..., SHADOW_DENSITY] = 0.1
+    states[..., LIGHTNING_DISTANCE] = 18.0
+    states[..., PHASE] = PHASE_BREWING
+    states[..., STAGE] = STAGE_IMPACT
+
+
+def run_ensemble(n_storms, seed=0):
+    states = np.zeros((n_storms, N_VARS), dtype=np.float64)
+    _seed_initial(states)
+    if storm_native is not None:
+        iterations = storm_native.simulate_ensemble(states, seed)
+    else:
+        iterations = _simulate_ensemble(states, seed)
+    return states, iterations
+
+
+class Storm:
+    def __init__(self):
+        self.state = PHASE_BREWING
+        self.full_stage = STAGE_IMPACT
+        self.iteration = 0
+        s = np.zeros(N_VARS, dtype=np.float64)
+        _seed_initial(s)
+        self.s = s
+
+    def run(self):
+        s = self.s
+        if storm_native is not None:
+            self.iteration = storm_native.simulate(s, 0)
+        else:
+            self.iteration = _simulate(s, 0)
+        self.state = int(s[PHASE])
+        self.full_stage = int(s[STAGE])
 
 
 if __name__ == "__main__":